@@ -14,8 +14,17 @@ API_BASE_URL = "https://api.leneda.eu/api"
 DEFAULT_OBIS_CODE = "1-1:1.29.0"
 DEFAULT_INITIAL_SETUP_DAYS_TO_FETCH = 180
 POLLING_INTERVAL_HOURS = 2
+MAX_POLLING_INTERVAL_HOURS = 8 # Upper bound when backing off because the API returned nothing new
 API_MAX_DAYS_TO_FETCH = 30  # Fetch data in chunks of 30 days to not hit API limits
-API_MIN_DAYS_TO_FETCH = 2 # Minimum days to fetch even if last statistics was recent
+API_FETCH_OVERLAP_HOURS = 2 # Re-fetch this much before the last statistic to complete partial hours
+API_VALIDATOR_CACHE_SIZE = 16 # Number of requests whose ETag / Last-Modified is kept for conditional GETs
+API_EXECUTOR_DECODE_BYTES = 256 * 1024 # Decode larger responses in the executor
+API_TIMEOUT_SECONDS = 30
+API_CONNECT_TIMEOUT_SECONDS = 5
+API_INCREMENTAL_TIMEOUT_SECONDS = 10 # Short incremental windows return small payloads
+API_TIMEOUT_WARNING_COUNT = 3 # Consecutive polls with a timeout before logging a warning
+API_INCREMENTAL_MAX_DAYS = 2 # Windows up to this length count as incremental fetches
+API_MAX_CONCURRENT_REQUESTS = 4 # Concurrent API requests per config entry
 
 # Home Assistant OBIS Mapping
 OBIS_HA_MAP = {
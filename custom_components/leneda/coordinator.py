@@ -0,0 +1,109 @@
+"""Shared Leneda API access for the sensors of a config entry."""
+import asyncio
+import hashlib
+import logging
+from collections.abc import Mapping
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import (API_BASE_URL, API_VALIDATOR_CACHE_SIZE,
+                    API_EXECUTOR_DECODE_BYTES, API_MAX_CONCURRENT_REQUESTS, API_TIMEOUT_SECONDS,
+                    API_CONNECT_TIMEOUT_SECONDS, API_INCREMENTAL_TIMEOUT_SECONDS,
+                    CONF_API_KEY, CONF_ENERGY_ID, CONF_METERING_POINT)
+
+_LOGGER = logging.getLogger(__name__)
+
+_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT_SECONDS, connect=API_CONNECT_TIMEOUT_SECONDS)
+_INCREMENTAL_TIMEOUT = aiohttp.ClientTimeout(total=API_INCREMENTAL_TIMEOUT_SECONDS, connect=API_CONNECT_TIMEOUT_SECONDS)
+
+class LenedaDataCoordinator:
+    """Issues Leneda API requests on behalf of all sensors of one entry."""
+
+    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+        self.hass = hass
+        # HA's shared session; keeps its connection pool warm across polls and chunks
+        self._session = async_get_clientsession(hass)
+        # Metering point and credentials are fixed per entry
+        self._url_prefix = f"{API_BASE_URL}/metering-points/{config[CONF_METERING_POINT]}/"
+        self._headers = {
+            "X-API-KEY": config[CONF_API_KEY],
+            "X-ENERGY-ID": config[CONF_ENERGY_ID],
+            "Accept": "application/json"
+        }
+        self._semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        # (path, params) -> conditional request headers from the last 200 response, oldest first
+        self._validators: dict[tuple, dict[str, str]] = {}
+        # path -> digest of the last 200 response body
+        self._digests: dict[str, bytes] = {}
+
+    async def async_fetch(self, path: str, params: dict[str, Any], incremental: bool = False) -> dict | None:
+        """Fetch an API path, limiting how many requests run at once.
+
+        Incremental requests cover a short window and get a tighter timeout.
+        Returns None when the data is unchanged, either because the server
+        answered 304 to our If-None-Match / If-Modified-Since headers or
+        because the body is identical to the previous response for the same
+        path, so callers can skip processing, and {} when the request failed.
+        Timeouts are raised as TimeoutError.
+        """
+        key = (path, tuple(sorted(params.items())))
+        timeout = _INCREMENTAL_TIMEOUT if incremental else _TIMEOUT
+        # Chunked backfills run concurrently; cap the fan-out to stay clear of API rate limits
+        async with self._semaphore:
+            return await self._async_request(key, path, params, timeout)
+
+    async def _async_request(self, key: tuple, path: str, params: dict[str, Any],
+                             timeout: aiohttp.ClientTimeout) -> dict | None:
+        """Standardized API fetcher."""
+        url = self._url_prefix + path
+        headers = self._headers
+        validators = self._validators.get(key)
+        if validators:
+            headers = {**headers, **validators}
+
+        try:
+            async with self._session.get(url, params=params, headers=headers, timeout=timeout) as resp:
+                if resp.status == 304:
+                    _LOGGER.debug("Leneda API data unchanged for %s", path)
+                    return None
+                if resp.status == 200:
+                    raw = await resp.read()
+                    self._store_validators(key, resp.headers)
+                    # Servers without validators: detect an unchanged body before decoding it
+                    digest = hashlib.blake2b(raw, digest_size=8).digest()
+                    if self._digests.get(path) == digest:
+                        _LOGGER.debug("Leneda API data unchanged for %s", path)
+                        return None
+                    if len(raw) > API_EXECUTOR_DECODE_BYTES:
+                        # Large backfills would block the event loop while decoding
+                        data = await self.hass.async_add_executor_job(json_loads, raw)
+                    else:
+                        data = json_loads(raw)
+                    # Only a decoded body counts as seen; an undecodable one must keep failing
+                    self._digests[path] = digest
+                    return data
+                _LOGGER.error("Leneda API returned status %s for %s", resp.status, path)
+        except TimeoutError:
+            # Sensors decide how loudly to report, counting timed-out polls rather than requests
+            raise
+        except Exception as err:
+            _LOGGER.error("Error fetching Leneda data from %s: %s", path, err)
+        return {}
+
+    def _store_validators(self, key: tuple, resp_headers: Mapping[str, str]) -> None:
+        """Remember a response's ETag / Last-Modified, keeping only the most recent requests."""
+        self._validators.pop(key, None)
+        validators = {}
+        if etag := resp_headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := resp_headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        if not validators:
+            return
+        self._validators[key] = validators
+        if len(self._validators) > API_VALIDATOR_CACHE_SIZE:
+            del self._validators[next(iter(self._validators))]
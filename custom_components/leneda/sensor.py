@@ -1,7 +1,19 @@
+import asyncio
 import logging
-from datetime import timedelta
+from bisect import bisect_right
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 from typing import Any
 
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
@@ -9,158 +21,333 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import StatisticData, StatisticMetaData, StatisticMeanType
 from homeassistant.components.recorder.statistics import (
     async_import_statistics,
     get_last_statistics,
-    mean
 )
 from homeassistant.util import slugify, dt as dt_util
 
-from .const import (API_BASE_URL, CONF_API_KEY, CONF_ENERGY_ID,
-                    CONF_METERING_POINT, CONF_OBIS_CODE,
+from .const import (DOMAIN, CONF_METERING_POINT, CONF_OBIS_CODE,
                     CONF_INITIAL_SETUP_DAYS_TO_FETCH,
-                    API_MAX_DAYS_TO_FETCH, API_MIN_DAYS_TO_FETCH,
-                    POLLING_INTERVAL_HOURS, 
+                    API_MAX_DAYS_TO_FETCH, API_FETCH_OVERLAP_HOURS, API_INCREMENTAL_MAX_DAYS,
+                    API_TIMEOUT_WARNING_COUNT,
+                    POLLING_INTERVAL_HOURS, MAX_POLLING_INTERVAL_HOURS,
                     OBIS_HA_MAP, DEFAULT_OBIS_CODE)
+from .coordinator import LenedaDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(hours=POLLING_INTERVAL_HOURS)
+MAX_POLLING_INTERVAL = timedelta(hours=MAX_POLLING_INTERVAL_HOURS)
+
+_SAMPLE_TS = itemgetter(0)
+
+def _parse_leneda_ts(value: str) -> float | None:
+    """Parse a Leneda `startedAt` string into a POSIX timestamp."""
+    # datetime.fromisoformat is C-implemented and accepts the trailing "Z" on Python 3.11+
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_util.UTC)
+    return dt.timestamp()
+
+def _ciso8601_parse_ts(value: str) -> float | None:
+    """Parse a Leneda `startedAt` string with the ciso8601 C extension."""
+    try:
+        dt = ciso8601.parse_datetime(value)
+    except ValueError:
+        return _parse_leneda_ts(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_util.UTC)
+    return dt.timestamp()
+
+# ciso8601 ships with Home Assistant core; fall back to datetime.fromisoformat without it
+_fast_parse_ts = _parse_leneda_ts if ciso8601 is None else _ciso8601_parse_ts
+
+def _iso_z(value: dt_util.dt.datetime) -> str:
+    """Format a UTC datetime as the API's YYYY-MM-DDTHH:MM:SSZ without strftime."""
+    return (f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+            f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}Z")
+
+@lru_cache(maxsize=4096)
+def _hour_to_dt(ts: float) -> dt_util.dt.datetime:
+    """UTC datetime for a statistics start timestamp; hour starts recur across polls."""
+    return dt_util.utc_from_timestamp(ts)
+
+def _parse_items(items: list[dict[str, Any]]) -> list[tuple[float, float]]:
+    """Convert raw API items into time-ordered (timestamp, value) samples, dropping invalid dates."""
+    # Local aliases keep the comprehension on LOAD_FAST instead of global lookups
+    parse = _fast_parse_ts
+    to_float = float
+    samples = [
+        (ts, to_float(ii["value"])) for ii in items
+        if (ts := parse(ii["startedAt"])) is not None
+    ]
+    # Sort once here so every consumer can rely on chronological order
+    samples.sort(key=_SAMPLE_TS)
+    return samples
+
+def _hourly_stats(samples: list[tuple[float, float]]) -> Iterator[tuple[float, float, float, float]]:
+    """Yield (hour_start, mean, min, max) per hour of time-ordered samples in a single pass."""
+    block = None
+    total = low = high = 0.0
+    count = 0
+    for ts, val in samples:
+        hour = ts - ts % 3600
+        if hour != block:
+            if count:
+                yield block, total / count, low, high
+            block = hour
+            total = low = high = val
+            count = 1
+            continue
+        total += val
+        count += 1
+        if val < low:
+            low = val
+        elif val > high:
+            high = val
+    if count:
+        yield block, total / count, low, high
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up Leneda Power and Energy sensors."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    # The first update is scheduled from async_added_to_hass, once restored data is available
     async_add_entities([
-        LenedaMeteringSensor(hass, entry.data),
-        LenedaAggregatedMeteringSensor(hass, entry.data)
-    ], True)
+        LenedaMeteringSensor(hass, entry.data, coordinator),
+        LenedaAggregatedMeteringSensor(hass, entry.data, coordinator)
+    ])
+
+@dataclass
+class LenedaStoredData(ExtraStoredData):
+    """Last imported statistic, restored on startup instead of querying the recorder."""
+    last_stat_ts: float
+    last_sum: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
 
-class LenedaBaseSensor(SensorEntity):
+    @classmethod
+    def from_dict(cls, restored: dict[str, Any]) -> "LenedaStoredData | None":
+        try:
+            last_sum = restored.get("last_sum")
+            return cls(
+                last_stat_ts=float(restored["last_stat_ts"]),
+                last_sum=None if last_sum is None else float(last_sum)
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+class LenedaBaseSensor(SensorEntity, RestoreEntity):
     """Common logic for Leneda API sensors."""
     _attr_has_entity_name = True
     _attr_should_poll = True
     _attr_suggested_display_precision = 3
-
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+    base_params: dict[str, str] = {}
+    # OBIS_HA_MAP keys for this sensor's name, unit, device class and state class
+    name_key: str
+    unit_key: str
+    device_class_key: str
+    state_class_key: str
+
+    def __init__(self, hass: HomeAssistant, config: dict[str, Any], coordinator: LenedaDataCoordinator) -> None:
+        obis_code = config.get(CONF_OBIS_CODE, DEFAULT_OBIS_CODE)
+        mapping = OBIS_HA_MAP.get(obis_code, OBIS_HA_MAP[DEFAULT_OBIS_CODE])
+        self._attr_name = mapping[self.name_key]
+        self._attr_native_unit_of_measurement = mapping[self.unit_key]
+        self._attr_device_class = mapping[self.device_class_key]
+        self._attr_state_class = mapping[self.state_class_key]
+        self._attr_extra_state_attributes = {
+            "obis_code": obis_code,
+            "description": mapping["description"],
+            "service_type": mapping["service_type"]
+        }
         self.hass = hass
         self._config = config
+        self._coordinator = coordinator
         # Unique ID can have dots, but entity_id cannot.
         self._attr_unique_id = f"{config[CONF_METERING_POINT]}_{config[CONF_OBIS_CODE]}_{self.unique_id_suffix}"
         # Use slugify to ensure dots in OBIS codes become underscores in the entity_id
         self.entity_id = f"sensor.{slugify(self._attr_unique_id)}"
+        self._base_params = {"obisCode": config[CONF_OBIS_CODE], **self.base_params}
+        # Adaptive polling: back off while the API has nothing newer than already seen
+        self._poll_interval = SCAN_INTERVAL
+        self._next_poll: dt_util.dt.datetime | None = None
+        self._latest_sample_ts: float | None = None
+        # Consecutive polls with a timed-out request; a single slow poll is not worth a warning
+        self._timed_out_polls = 0
+        # Recorder lookup shared by everything that needs the last statistic during one update
+        self._last_stat: dict[str, Any] | None = None
+        self._last_stat_loaded = False
+        self._last_stat_restored = False
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        if (extra := await self.async_get_last_extra_data()) is not None:
+            if (stored := LenedaStoredData.from_dict(extra.as_dict())) is not None:
+                self._last_stat = {"start": stored.last_stat_ts, "sum": stored.last_sum}
+                self._last_stat_loaded = True
+                self._last_stat_restored = True
+        self.async_schedule_update_ha_state(True)
+
+    @property
+    def extra_restore_state_data(self) -> LenedaStoredData | None:
+        if not self._last_stat:
+            return None
+        start = self._last_stat["start"]
+        if not isinstance(start, (int, float)):
+            start = start.timestamp()
+        return LenedaStoredData(last_stat_ts=start, last_sum=self._last_stat.get("sum"))
+
+    def _reset_last_stat(self) -> None:
+        """Drop the cached last statistic, except a restored one no update has used yet."""
+        if self._last_stat_restored:
+            self._last_stat_restored = False
+        else:
+            self._last_stat_loaded = False
+
+    def _poll_due(self, now: dt_util.dt.datetime) -> bool:
+        return self._next_poll is None or now >= self._next_poll
+
+    def _adjust_interval(self, samples: list[tuple[float, float]], now: dt_util.dt.datetime, failed: bool) -> None:
+        """Reset the poll interval on new data, otherwise double it up to the maximum.
+
+        A poll with failed requests says nothing about whether new data exists, so it never extends the interval.
+        """
+        latest = samples[-1][0] if samples else None
+        if latest is not None and (self._latest_sample_ts is None or latest > self._latest_sample_ts):
+            self._latest_sample_ts = latest
+            self._poll_interval = SCAN_INTERVAL
+        elif not failed:
+            self._poll_interval = min(self._poll_interval * 2, MAX_POLLING_INTERVAL)
+        # HA still ticks every SCAN_INTERVAL; half a tick of slack lands the next poll on a tick
+        self._next_poll = now + self._poll_interval - SCAN_INTERVAL / 2
+
+    async def _load_last_stat(self) -> dict[str, Any] | None:
+        """Latest statistics row of this entity, queried at most once per update cycle."""
+        if not self._last_stat_loaded:
+            recorder = get_instance(self.hass)
+            last_stats = await recorder.async_add_executor_job(
+                get_last_statistics, self.hass, 1, self.entity_id, True, {"state", "sum"}
+            )
+            self._last_stat = None
+            if last_stats and last_stats.get(self.entity_id):
+                self._last_stat = last_stats[self.entity_id][0]
+            self._last_stat_loaded = True
+        return self._last_stat
 
     async def get_last_timestamp(self) -> dt_util.dt.datetime | None:
-        recorder = get_instance(self.hass)
-
-        last_state_stats = await recorder.async_add_executor_job(
-            get_last_statistics, self.hass, 1, self.entity_id, True, {"state"}
-        )
-
-        last_time = None
-        if last_state_stats and self.entity_id in last_state_stats:
-            last_time = last_state_stats[self.entity_id][0]["start"]
+        last_stat = await self._load_last_stat()
+        last_time = last_stat["start"] if last_stat else None
 
         if isinstance(last_time, (int, float)):
             last_time = dt_util.utc_from_timestamp(last_time)
 
         return last_time
 
-    async def get_days_to_fetch(self) -> int:
-        initial_setup_days = self._config[CONF_INITIAL_SETUP_DAYS_TO_FETCH]
+    async def get_fetch_start(self, end_time: dt_util.dt.datetime) -> dt_util.dt.datetime | None:
+        """Start of the window to request: a short overlap before the last statistic, or the initial backfill.
 
+        Returns None when the last statistic is younger than one data interval, so nothing new can exist yet.
+        """
         last_timestamp = await self.get_last_timestamp()
         if last_timestamp:
-            days_since_last = (dt_util.now(dt_util.UTC) - last_timestamp).days
-            days_since_last += 1
-            fetch_days = max(days_since_last, API_MIN_DAYS_TO_FETCH)
-        else:
-            fetch_days = initial_setup_days
-
-        return fetch_days
-
-    async def _fetch_from_api(self, path: str, params: dict[str, Any]) -> dict:
-        """Standardized API fetcher."""
-        session = async_get_clientsession(self.hass)
-        url = f"{API_BASE_URL}/metering-points/{self._config[CONF_METERING_POINT]}/{path}"
-        headers = {
-            "X-API-KEY": self._config[CONF_API_KEY],
-            "X-ENERGY-ID": self._config[CONF_ENERGY_ID]
-        }
+            if end_time - last_timestamp < self.data_interval:
+                return None
+            return last_timestamp - timedelta(hours=API_FETCH_OVERLAP_HOURS)
+        return end_time - timedelta(days=self._config[CONF_INITIAL_SETUP_DAYS_TO_FETCH])
+
+    async def _fetch_items(self, start_time: dt_util.dt.datetime,
+                           end_time: dt_util.dt.datetime) -> tuple[list[dict[str, Any]], bool]:
+        """Fetch the window in API-sized chunks, issuing the chunk requests concurrently.
+
+        Returns the items and whether any chunk request failed.
+        """
+        incremental = end_time - start_time <= timedelta(days=API_INCREMENTAL_MAX_DAYS)
+        windows = []
+        chunk_start = start_time
+        while chunk_start < end_time:
+            chunk_end = min(chunk_start + timedelta(days=API_MAX_DAYS_TO_FETCH), end_time)
+            windows.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
 
-        try:
-            async with session.get(url, params=params, headers=headers, timeout=30) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data
-                _LOGGER.error("Leneda API returned status %s for %s", resp.status, path)
-        except Exception as err:
-            _LOGGER.error("Error fetching Leneda data from %s: %s", path, err)
-        return {}
+        results = await asyncio.gather(*(
+            self._coordinator.async_fetch(self.api_path, self._window_params(start, end), incremental)
+            for start, end in windows
+        ), return_exceptions=True)
+        timed_out = False
+        for i, data in enumerate(results):
+            if isinstance(data, TimeoutError):
+                timed_out = True
+                results[i] = {}
+            elif isinstance(data, BaseException):
+                raise data
+        self._track_timeouts(timed_out)
+        # None means unchanged since the last poll, already imported; {} means the request failed
+        failed = any(data is not None and not data for data in results)
+        return [item for data in results if data for item in data.get(self.items_key, [])], failed
+
+    def _track_timeouts(self, timed_out: bool) -> None:
+        """Log a timed-out poll, warning only once timeouts repeat over consecutive polls."""
+        if not timed_out:
+            self._timed_out_polls = 0
+            return
+        self._timed_out_polls += 1
+        if self._timed_out_polls >= API_TIMEOUT_WARNING_COUNT:
+            _LOGGER.warning("Leneda API timed out for %s in %s polls in a row", self.api_path, self._timed_out_polls)
+        else:
+            _LOGGER.debug("Leneda API timed out for %s", self.api_path)
 
 class LenedaMeteringSensor(LenedaBaseSensor):
     """15-minute metering data sensor (kW) - Aggregated to Hourly for Statistics."""
     unique_id_suffix = "pwr_15min"
-
-    def __init__(self, hass, config):
-        obis_code = config.get(CONF_OBIS_CODE, DEFAULT_OBIS_CODE)
-        mapping = OBIS_HA_MAP.get(obis_code, OBIS_HA_MAP[DEFAULT_OBIS_CODE])
-        self._attr_name = mapping["name"]
-        self._attr_native_unit_of_measurement = mapping["unit"]
-        self._attr_device_class = mapping["device_class"]
-        self._attr_state_class = mapping["state_class"]
-        self._attr_extra_state_attributes = {
-            "obis_code": obis_code,
-            "description": mapping["description"],
-            "service_type": mapping["service_type"]
+    api_path = "time-series"
+    data_interval = timedelta(minutes=15)
+    items_key = "items"
+    name_key = "name"
+    unit_key = "unit"
+    device_class_key = "device_class"
+    state_class_key = "state_class"
+
+    def _window_params(self, start: dt_util.dt.datetime, end: dt_util.dt.datetime) -> dict[str, str]:
+        return {
+            **self._base_params,
+            "startDateTime": _iso_z(start),
+            "endDateTime": _iso_z(end),
         }
-        super().__init__(hass, config)
 
     async def async_update(self) -> None:
-        fetch_days = await self.get_days_to_fetch()
         end_time = dt_util.now(dt_util.UTC)
-        start_time = end_time - timedelta(days=fetch_days)
-
-        items = []
-        chunk_start = start_time
-        while chunk_start < end_time:
-            chunk_end = min(chunk_start + timedelta(days=API_MAX_DAYS_TO_FETCH), end_time)
-            params = {
-                "startDateTime": chunk_start.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "endDateTime": chunk_end.strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "obisCode": self._config[CONF_OBIS_CODE],
-            }
-            data = await self._fetch_from_api("time-series", params)
-            chunk_start = chunk_end
-            chunk_items = data.get("items", [])
-            if chunk_items:
-                items.extend(chunk_items)
+        if not self._poll_due(end_time):
+            return
+        self._reset_last_stat()
+        start_time = await self.get_fetch_start(end_time)
+        if start_time is None:
+            return
+        items, failed = await self._fetch_items(start_time, end_time)
 
         _LOGGER.info(f"Leneda Sensor fetched {len(items)} items")
 
-        if not items:
+        samples = _parse_items(items)
+        self._adjust_interval(samples, end_time, failed)
+        if not samples:
             return
 
         # Group 15-min items by Hour (Required by HA Statistics)
-        hourly_data: dict[dt_util.dt.datetime, list[float]] = {}
-        for ii in items:
-            dt = dt_util.parse_datetime(ii["startedAt"])
-            if dt is None: 
-                continue # Skip invalid dates
-
-            hour_ts = dt.replace(minute=0, second=0, microsecond=0)
-            if hour_ts not in hourly_data: 
-                hourly_data[hour_ts] = []
-            hourly_data[hour_ts].append(float(ii["value"]))
-
         stats = [
             StatisticData(
-                start=ts,
-                state=mean(vals), mean=mean(vals),
-                min=min(vals), max=max(vals)
-            ) for ts, vals in hourly_data.items()
+                start=_hour_to_dt(hour),
+                state=avg, mean=avg,
+                min=low, max=high
+            ) for hour, avg, low, high in _hourly_stats(samples)
         ]
+        self._last_stat = {"start": stats[-1]["start"].timestamp()}
 
         metadata = StatisticMetaData(
             mean_type=StatisticMeanType.ARITHMETIC, has_sum=False, name=self._attr_name,
@@ -173,47 +360,41 @@ class LenedaMeteringSensor(LenedaBaseSensor):
 class LenedaAggregatedMeteringSensor(LenedaBaseSensor):
     """Hourly Aggregated metering data sensor."""
     unique_id_suffix = "energy_hourly"
-
-    def __init__(self, hass, config):
-        obis_code = config.get(CONF_OBIS_CODE, DEFAULT_OBIS_CODE)
-        mapping = OBIS_HA_MAP.get(obis_code, OBIS_HA_MAP[DEFAULT_OBIS_CODE])
-        self._attr_name = mapping["aggregated_name"]
-        self._attr_native_unit_of_measurement = mapping["aggregation_unit"]
-        self._attr_device_class = mapping["aggregation_device_class"]
-        self._attr_state_class = mapping["aggregation_state_class"]
-        self._attr_extra_state_attributes = {
-            "obis_code": obis_code,
-            "description": mapping["description"],
-            "service_type": mapping["service_type"]
+    api_path = "time-series/aggregated"
+    data_interval = timedelta(hours=1)
+    items_key = "aggregatedTimeSeries"
+    name_key = "aggregated_name"
+    unit_key = "aggregation_unit"
+    device_class_key = "aggregation_device_class"
+    state_class_key = "aggregation_state_class"
+    base_params = {
+        "aggregationLevel": "Hour",
+        "transformationMode": "Accumulation",
+    }
+
+    def _window_params(self, start: dt_util.dt.datetime, end: dt_util.dt.datetime) -> dict[str, str]:
+        return {
+            **self._base_params,
+            "startDate": start.date().isoformat(),
+            "endDate": end.date().isoformat(),
         }
-        super().__init__(hass, config)
 
     async def async_update(self) -> None:
         """Fetch hourly aggregated data and import energy statistics."""
-        fetch_days = await self.get_days_to_fetch()
         end_time = dt_util.now(dt_util.UTC)
-        start_time = end_time - timedelta(days=fetch_days)
-
-        items = []
-        chunk_start = start_time
-        while chunk_start < end_time:
-            chunk_end = min(chunk_start + timedelta(days=API_MAX_DAYS_TO_FETCH), end_time)
-            params = {
-                "aggregationLevel": "Hour",
-                "startDate": chunk_start.strftime("%Y-%m-%d"),
-                "endDate": chunk_end.strftime("%Y-%m-%d"),
-                "obisCode": self._config[CONF_OBIS_CODE],
-                "transformationMode": "Accumulation",
-            }
-            data = await self._fetch_from_api("time-series/aggregated", params)
-            chunk_start = chunk_end
-            chunk_items = data.get("aggregatedTimeSeries", [])
-            if chunk_items:
-                items.extend(chunk_items)
+        if not self._poll_due(end_time):
+            return
+        self._reset_last_stat()
+        start_time = await self.get_fetch_start(end_time)
+        if start_time is None:
+            return
+        items, failed = await self._fetch_items(start_time, end_time)
 
         _LOGGER.info(f"Leneda Aggregated Sensor fetched {len(items)} items")
 
-        if not items:
+        samples = _parse_items(items)
+        self._adjust_interval(samples, end_time, failed)
+        if not samples:
             return
 
         # 1. Update live sensor state
@@ -230,42 +411,28 @@ class LenedaAggregatedMeteringSensor(LenedaBaseSensor):
         # 3. Handle Cumulative Sum (Vital for Energy Dashboard)
         # We fetch the last sum from the DB so we can continue the sequence
 
-        recorder = get_instance(self.hass)
-
         # --- 1. Get last SUM ---
-        last_sum_stats = await recorder.async_add_executor_job(
-            get_last_statistics, self.hass, 1, self.entity_id, True, {"sum"}
-        )
-
-        running_sum = 0.0
-        if last_sum_stats and self.entity_id in last_sum_stats:
-            running_sum = last_sum_stats[self.entity_id][0].get("sum") or 0.0
+        last_stat = await self._load_last_stat()
+        running_sum = (last_stat.get("sum") if last_stat else None) or 0.0
 
         # --- 2. Get last TIMESTAMP ---
         last_time = await self.get_last_timestamp()
 
         # --- 3. Build new statistics ---
-        stat_data = []
-
-        for item in items:
-            item_time = dt_util.parse_datetime(item["startedAt"])
-            if item_time is None:
-                continue
-
-            # Prevent double-counting
-            if last_time and item_time <= last_time:
-                continue
-
-            val = float(item["value"])
-            running_sum += val
-
-            stat_data.append(
-                StatisticData(
-                    start=item_time,
-                    state=val,
-                    sum=running_sum
-                )
-            )
+        # Prevent double-counting: samples are sorted, so skip everything up to the last statistic at once
+        first_new = bisect_right(samples, last_time.timestamp(), key=_SAMPLE_TS) if last_time else 0
+        new_samples = samples[first_new:]
+        if not new_samples:
+            return
 
-        if stat_data:
-            async_import_statistics(self.hass, metadata, stat_data)
+        # Columns for the computation, one dict per row only when handing over to the recorder
+        timestamps, values = zip(*new_samples)
+        sums = accumulate(values, initial=running_sum)
+        next(sums) # The initial value is the stored sum, not a new row
+        hour_to_dt = _hour_to_dt
+        stat_data = [
+            StatisticData(start=hour_to_dt(ts), state=val, sum=total)
+            for ts, val, total in zip(timestamps, values, sums)
+        ]
+        async_import_statistics(self.hass, metadata, stat_data)
+        self._last_stat = {"start": timestamps[-1], "sum": stat_data[-1]["sum"]}